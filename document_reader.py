@@ -1,31 +1,229 @@
 import docx
-import pdfplumber
+import pypdfium2 as pdfium
 import sqlite3
 import re
 import os
+import json
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from operator import itemgetter
 from typing import List, Dict, Optional
 
-def read_docx(file_path: str) -> List[str]:
-    """Read text from a .docx file, returning lines."""
+# WordprocessingML tags for paragraphs and text runs
+_W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+_W_P = '{%s}p' % _W_NS
+_W_R = '{%s}r' % _W_NS
+_W_HYPERLINK = '{%s}hyperlink' % _W_NS
+_W_T = '{%s}t' % _W_NS
+_W_BR = '{%s}br' % _W_NS
+_W_BR_TYPE = '{%s}type' % _W_NS
+# Run children rendered as fixed characters, as python-docx's run text does
+_W_RUN_CHARS = {
+    '{%s}tab' % _W_NS: '\t',
+    '{%s}ptab' % _W_NS: '\t',
+    '{%s}cr' % _W_NS: '\n',
+    '{%s}noBreakHyphen' % _W_NS: '-',
+}
+
+# Section headings and keyword patterns used by parse_resume
+_HEADINGS = frozenset({'EDUCATION', 'TECHNICAL SKILLS', 'PROJECTS', 'EXPERIENCE',
+                       'FORAGE PROJECTS', 'MARKETING PROJECTS', 'CERTIFICATIONS'})
+_MAX_HEADING_LEN = max(map(len, _HEADINGS))
+_PROJECT_HEADINGS = frozenset({'FORAGE PROJECTS', 'MARKETING PROJECTS'})
+_PROJECT_TITLE_RE = re.compile(r'^(?:\d+\.\s+|\*\*)')
+_EDU_KW_RE = re.compile(r'University|Institute|College')
+_DEGREE_RE = re.compile(r'Master|Bachelor|Diploma')
+_EXP_LOC_RE = re.compile(r'India|USA|MA|WB|OD')
+_ROLE_RE = re.compile(r'Manager|Executive|Intern|Expert|Founder')
+_BULLETS = frozenset('-•')
+
+def _run_text(run) -> str:
+    """Text of a <w:r> element, matching python-docx's Run.text."""
+    parts = []
+    for child in run:
+        if child.tag == _W_T:
+            parts.append(child.text or '')
+        elif child.tag == _W_BR:
+            # Page and column breaks carry no text
+            if child.get(_W_BR_TYPE, 'textWrapping') == 'textWrapping':
+                parts.append('\n')
+        elif child.tag in _W_RUN_CHARS:
+            parts.append(_W_RUN_CHARS[child.tag])
+    return ''.join(parts)
+
+def _paragraph_text(p) -> str:
+    """Text of a <w:p> element from its runs, including runs inside hyperlinks."""
+    parts = []
+    for child in p:
+        if child.tag == _W_R:
+            parts.append(_run_text(child))
+        elif child.tag == _W_HYPERLINK:
+            parts.extend(_run_text(run) for run in child if run.tag == _W_R)
+    return ''.join(parts)
+
+def read_docx(file_path: str, layout: bool = False) -> List[str]:
+    """Read text from a .docx file, returning lines.
+
+    Walks the body's <w:p> elements directly rather than building python-docx
+    Paragraph and Run wrappers, since only the text is needed. layout has no
+    effect; it is accepted so every reader in _READERS shares one signature.
+    """
     doc = docx.Document(file_path)
     lines = []
-    for para in doc.paragraphs:
-        if para.text.strip():
-            lines.append(para.text.strip())
+    for p in doc.element.body.iterchildren(_W_P):
+        text = _paragraph_text(p).strip()
+        if text:
+            lines.append(text)
     return lines
 
-def read_pdf(file_path: str) -> List[str]:
-    """Read text from a PDF file, returning lines."""
+def read_pdf(file_path: str, layout: bool = False) -> List[str]:
+    """Read text from a PDF file, returning lines.
+
+    Uses PDFium for plain text extraction. Pass layout=True to use pdfplumber's
+    layout analysis instead, which handles tables better but is much slower.
+    """
+    if layout:
+        return _read_pdf_layout(file_path)
+
+    lines = []
+    pdf = pdfium.PdfDocument(file_path)
+    try:
+        for page in pdf:
+            textpage = page.get_textpage()
+            text = textpage.get_text_bounded()
+            lines.extend([line for line in map(str.strip, text.split('\n')) if line])
+            textpage.close()
+            page.close()
+    finally:
+        pdf.close()
+    return lines
+
+def _read_pdf_layout(file_path: str) -> List[str]:
+    """Read text from a PDF file with pdfplumber, returning lines."""
+    import pdfplumber  # optional, only needed for layout-aware extraction
+
     lines = []
     with pdfplumber.open(file_path) as pdf:
         for page in pdf.pages:
             text = page.extract_text()
             if text:
-                lines.extend([line.strip() for line in text.split('\n') if line.strip()])
+                lines.extend([line for line in map(str.strip, text.split('\n')) if line])
+            page.flush_cache()  # free this page's char/layout objects before the next one
     return lines
 
+@dataclass
+class _ParseState:
+    """Mutable state carried across lines while parsing a resume."""
+    section: Optional[str] = None
+    project_title: Optional[str] = None
+    project_desc: List[str] = field(default_factory=list)
+
+def _bullet_text(line: str) -> str:
+    """Strip bullet markers from a line."""
+    return line.replace('-', '').replace('•', '').strip()
+
+def _clean_title(line: str) -> str:
+    """Strip a leading 'N. ' or '**' and a trailing '**' from a project title."""
+    title = line
+    if title.endswith('**'):
+        title = title[:-2]
+    if title.startswith('**'):
+        title = title[2:]
+    elif title[:1].isdigit():
+        i = 1
+        while i < len(title) and title[i].isdigit():
+            i += 1
+        if title[i:i + 1] == '.' and title[i + 1:i + 2].isspace():
+            title = title[i + 1:]
+    return title.strip()
+
+def _flush_project(data: Dict[str, any], state: _ParseState):
+    """Save the project being collected, if it has a description."""
+    if state.project_title and state.project_desc:
+        data['Projects'].append({'title': state.project_title, 'description': ' '.join(state.project_desc)})
+        state.project_desc = []
+
+def _handle_education(line: str, data: Dict[str, any], state: _ParseState):
+    if '–' in line and _EDU_KW_RE.search(line):
+        parts = line.split('–')
+        institution = parts[0].strip()
+        location = parts[1].strip() if len(parts) > 1 else ''
+        data['Education'].append({'institution': institution, 'location': location, 'degree': '', 'dates': '', 'coursework': ''})
+    elif _DEGREE_RE.search(line):
+        data['Education'][-1]['degree'] = line
+    elif '|' in line:
+        data['Education'][-1]['dates'] = line
+    elif 'Relevant Coursework' in line:
+        data['Education'][-1]['coursework'] = line.replace('Relevant Coursework: ', '')
+
+def _handle_skills(line: str, data: Dict[str, any], state: _ParseState):
+    if line[:1] == '•':
+        category, skills = line.split(':', 1)
+        category = category.replace('•', '').strip()
+        skills = [s.strip() for s in skills.split(',')]
+        data['TechnicalSkills'].append({'category': category, 'skills': skills})
+
+def _project_bullet(line: str, data: Dict[str, any], state: _ParseState):
+    # An all-caps bullet is still a title
+    if line.isupper():
+        _flush_project(data, state)
+        state.project_title = _clean_title(line)
+    elif state.project_title:
+        state.project_desc.append(_bullet_text(line))
+
+def _project_text(line: str, data: Dict[str, any], state: _ParseState):
+    # All-caps lines are treated as titles, anything else as description
+    if line.isupper():
+        _flush_project(data, state)
+        state.project_title = _clean_title(line)
+    elif state.project_title:  # Handle non-bullet description
+        state.project_desc.append(line)
+
+def _project_title(line: str, data: Dict[str, any], state: _ParseState):
+    # Numbered or bold-like title
+    if _PROJECT_TITLE_RE.match(line):
+        _flush_project(data, state)
+        state.project_title = _clean_title(line)
+    else:
+        _project_text(line, data, state)
+
+_PROJECT_LINE_HANDLERS = {'-': _project_bullet, '•': _project_bullet, '*': _project_title}
+_PROJECT_LINE_HANDLERS.update(dict.fromkeys('0123456789', _project_title))
+
+def _handle_projects(line: str, data: Dict[str, any], state: _ParseState):
+    _PROJECT_LINE_HANDLERS.get(line[:1], _project_text)(line, data, state)
+
+def _handle_experience(line: str, data: Dict[str, any], state: _ParseState):
+    if '–' in line and _EXP_LOC_RE.search(line):
+        parts = line.split('–')
+        company = parts[0].strip()
+        location = parts[1].strip()
+        data['Experience'].append({'company': company, 'location': location, 'role': '', 'dates': '', 'responsibilities': []})
+    elif _ROLE_RE.search(line):
+        data['Experience'][-1]['role'] = line
+    elif '|' in line:
+        data['Experience'][-1]['dates'] = line
+    elif line[:1] in _BULLETS:
+        data['Experience'][-1]['responsibilities'].append(_bullet_text(line))
+
+def _handle_certifications(line: str, data: Dict[str, any], state: _ParseState):
+    if line[:1] in _BULLETS:
+        data['Certifications'].append(_bullet_text(line))
+
+_SECTION_HANDLERS = {
+    'EDUCATION': _handle_education,
+    'TECHNICAL SKILLS': _handle_skills,
+    'PROJECTS': _handle_projects,
+    'EXPERIENCE': _handle_experience,
+    'CERTIFICATIONS': _handle_certifications,
+}
+
 def parse_resume(lines: List[str]) -> Dict[str, any]:
-    """Parse resume lines into structured sections."""
+    """Parse resume lines into structured sections.
+
+    Lines are expected to be stripped, as returned by read_docx and read_pdf.
+    """
     data = {
         'Education': [],
         'TechnicalSkills': [],
@@ -33,84 +231,42 @@ def parse_resume(lines: List[str]) -> Dict[str, any]:
         'Experience': [],
         'Certifications': []
     }
-    current_section = None
-    project_title = None
-    project_desc = []
+    state = _ParseState()
+    handler = None
 
     for line in lines:
-        # Identify section headings
-        if line.upper() in ['EDUCATION', 'TECHNICAL SKILLS', 'PROJECTS', 'EXPERIENCE', 'FORAGE PROJECTS', 'MARKETING PROJECTS', 'CERTIFICATIONS']:
-            current_section = line.upper()
-            if current_section in ['FORAGE PROJECTS', 'MARKETING PROJECTS']:
-                current_section = 'PROJECTS'  # Merge into Projects
+        # Identify section headings (only short lines can be one)
+        if len(line) <= _MAX_HEADING_LEN and line.upper() in _HEADINGS:
+            state.section = line.upper()
+            if state.section in _PROJECT_HEADINGS:
+                state.section = 'PROJECTS'  # Merge into Projects
+            handler = _SECTION_HANDLERS[state.section]
             continue
 
         # Skip empty lines
-        if not line.strip():
+        if not line:
             continue
 
         # Parse based on current section
-        if current_section == 'EDUCATION':
-            if '–' in line and any(keyword in line for keyword in ['University', 'Institute', 'College']):
-                institution = line.split('–')[0].strip()
-                location = line.split('–')[1].strip() if len(line.split('–')) > 1 else ''
-                data['Education'].append({'institution': institution, 'location': location, 'degree': '', 'dates': '', 'coursework': ''})
-            elif any(keyword in line for keyword in ['Master', 'Bachelor', 'Diploma']):
-                data['Education'][-1]['degree'] = line
-            elif '|' in line:
-                data['Education'][-1]['dates'] = line
-            elif 'Relevant Coursework' in line:
-                data['Education'][-1]['coursework'] = line.replace('Relevant Coursework: ', '')
-
-        elif current_section == 'TECHNICAL SKILLS':
-            if line.startswith('•'):
-                category, skills = line.split(':', 1)
-                category = category.replace('•', '').strip()
-                skills = [s.strip() for s in skills.split(',')]
-                data['TechnicalSkills'].append({'category': category, 'skills': skills})
-
-        elif current_section == 'PROJECTS':
-            # Check for project title (numbered or bold-like)
-            if re.match(r'^\d+\.\s+', line) or line.isupper() or line.startswith('**'):
-                if project_title and project_desc:  # Save previous project
-                    data['Projects'].append({'title': project_title, 'description': ' '.join(project_desc)})
-                    project_desc = []
-                project_title = re.sub(r'^\d+\.\s+|^\*\*|\*\*$', '', line).strip()
-            elif line.startswith('-') or line.startswith('•'):
-                if project_title:
-                    project_desc.append(line.replace('-', '').replace('•', '').strip())
-            elif project_title:  # Handle non-bullet description
-                project_desc.append(line.strip())
-
-        elif current_section == 'EXPERIENCE':
-            if '–' in line and any(keyword in line for keyword in ['India', 'USA', 'MA', 'WB', 'OD']):
-                company = line.split('–')[0].strip()
-                location = line.split('–')[1].strip()
-                data['Experience'].append({'company': company, 'location': location, 'role': '', 'dates': '', 'responsibilities': []})
-            elif any(keyword in line for keyword in ['Manager', 'Executive', 'Intern', 'Expert', 'Founder']):
-                data['Experience'][-1]['role'] = line
-            elif '|' in line:
-                data['Experience'][-1]['dates'] = line
-            elif line.startswith('-') or line.startswith('•'):
-                data['Experience'][-1]['responsibilities'].append(line.replace('-', '').replace('•', '').strip())
-
-        elif current_section == 'CERTIFICATIONS':
-            if line.startswith('-') or line.startswith('•'):
-                data['Certifications'].append(line.replace('-', '').replace('•', '').strip())
+        if handler:
+            handler(line, data, state)
 
     # Save the last project if exists
-    if project_title and project_desc:
-        data['Projects'].append({'title': project_title, 'description': ' '.join(project_desc)})
+    _flush_project(data, state)
 
     return data
 
 def create_database(db_path: str) -> sqlite3.Connection:
     """Create SQLite database with tables for resume data."""
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    # Autocommit mode: insert_data opens its own transaction explicitly
+    conn = sqlite3.connect(db_path, isolation_level=None, cached_statements=256)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    # Create tables in one batch
+    conn.executescript('''
+        BEGIN;
 
-    # Create tables
-    cursor.execute('''
         CREATE TABLE IF NOT EXISTS Education (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             institution TEXT,
@@ -118,101 +274,131 @@ def create_database(db_path: str) -> sqlite3.Connection:
             degree TEXT,
             dates TEXT,
             coursework TEXT
-        )
-    ''')
+        );
 
-    cursor.execute('''
         CREATE TABLE IF NOT EXISTS TechnicalSkills (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             category TEXT,
-            skills TEXT
-        )
-    ''')
+            skills JSON
+        );
 
-    cursor.execute('''
         CREATE TABLE IF NOT EXISTS Projects (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             title TEXT,
             description TEXT
-        )
-    ''')
+        );
 
-    cursor.execute('''
         CREATE TABLE IF NOT EXISTS Experience (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             company TEXT,
             location TEXT,
             role TEXT,
             dates TEXT,
-            responsibilities TEXT
-        )
-    ''')
+            responsibilities JSON
+        );
 
-    cursor.execute('''
         CREATE TABLE IF NOT EXISTS Certifications (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT
-        )
+        );
+
+        COMMIT;
     ''')
 
-    conn.commit()
     return conn
 
-def insert_data(conn: sqlite3.Connection, data: Dict[str, any]):
-    """Insert parsed resume data into the database."""
-    cursor = conn.cursor()
+# Column order of the Education and Projects INSERTs
+_EDUCATION_ROW = itemgetter('institution', 'location', 'degree', 'dates', 'coursework')
+_PROJECT_ROW = itemgetter('title', 'description')
 
-    # Insert Education
-    for edu in data['Education']:
-        cursor.execute('''
+def insert_data(conn: sqlite3.Connection, data: Dict[str, any]):
+    """Insert parsed resume data into the database in a single transaction."""
+    conn.execute("BEGIN")
+    try:
+        # Insert Education
+        conn.executemany('''
             INSERT INTO Education (institution, location, degree, dates, coursework)
             VALUES (?, ?, ?, ?, ?)
-        ''', (edu['institution'], edu['location'], edu['degree'], edu['dates'], edu['coursework']))
+        ''', map(_EDUCATION_ROW, data['Education']))
 
-    # Insert Technical Skills
-    for skill in data['TechnicalSkills']:
-        cursor.execute('''
+        # Insert Technical Skills
+        conn.executemany('''
             INSERT INTO TechnicalSkills (category, skills)
             VALUES (?, ?)
-        ''', (skill['category'], ', '.join(skill['skills'])))
+        ''', [(skill['category'], json.dumps(skill['skills'], ensure_ascii=False))
+              for skill in data['TechnicalSkills']])
 
-    # Insert Projects
-    for project in data['Projects']:
-        cursor.execute('''
+        # Insert Projects
+        conn.executemany('''
             INSERT INTO Projects (title, description)
             VALUES (?, ?)
-        ''', (project['title'], project['description']))
+        ''', map(_PROJECT_ROW, data['Projects']))
 
-    # Insert Experience
-    for exp in data['Experience']:
-        cursor.execute('''
+        # Insert Experience
+        conn.executemany('''
             INSERT INTO Experience (company, location, role, dates, responsibilities)
             VALUES (?, ?, ?, ?, ?)
-        ''', (exp['company'], exp['location'], exp['role'], exp['dates'], '; '.join(exp['responsibilities'])))
+        ''', [(exp['company'], exp['location'], exp['role'], exp['dates'], json.dumps(exp['responsibilities'], ensure_ascii=False))
+              for exp in data['Experience']])
 
-    # Insert Certifications
-    for cert in data['Certifications']:
-        cursor.execute('''
+        # Insert Certifications
+        conn.executemany('''
             INSERT INTO Certifications (name)
             VALUES (?)
-        ''', (cert,))
+        ''', [(cert,) for cert in data['Certifications']])
 
-    conn.commit()
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
 
-def main(file_path: str, db_path: str = 'resume.db'):
-    """Main function to process resume and create database."""
-    # Determine file type
+# Readers by file extension; each takes (file_path, layout=False)
+_READERS = {
+    '.docx': read_docx,
+    '.pdf': read_pdf,
+}
+
+def read_resume(file_path: str, layout: bool = False) -> List[str]:
+    """Read lines from a .docx or .pdf resume, picking the reader by file type."""
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"File {file_path} not found.")
 
-    if file_path.endswith('.docx'):
-        lines = read_docx(file_path)
-    elif file_path.endswith('.pdf'):
-        lines = read_pdf(file_path)
-    else:
+    reader = _READERS.get(os.path.splitext(file_path)[1].lower())
+    if reader is None:
         raise ValueError("Unsupported file format. Use .docx or .pdf.")
+    return reader(file_path, layout=layout)
+
+def _parse_one(file_path: str, layout: bool = False) -> Dict[str, any]:
+    """Read and parse a single resume (runs in a worker process)."""
+    return parse_resume(read_resume(file_path, layout=layout))
+
+def main_batch(file_paths: List[str], db_path: str = 'resume.db', layout: bool = False,
+               max_workers: Optional[int] = None) -> List[str]:
+    """Parse many resumes in parallel and load them all into one database.
+
+    A file that fails to read, parse or insert is reported and skipped, so the
+    rest of the batch is still loaded. Returns the paths that failed.
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [(path, executor.submit(_parse_one, path, layout)) for path in file_paths]
 
-    # Parse resume
+    failed = []
+    conn = create_database(db_path)
+    try:
+        for path, future in futures:
+            try:
+                insert_data(conn, future.result())
+            except Exception as e:
+                print(f"Error: {path}: {e}")
+                failed.append(path)
+    finally:
+        conn.close()
+    return failed
+
+def main(file_path: str, db_path: str = 'resume.db', layout: bool = False):
+    """Main function to process resume and create database."""
+    # Read and parse resume
+    lines = read_resume(file_path, layout=layout)
     data = parse_resume(lines)
 
     # Create and populate database
@@ -230,9 +416,15 @@ def main(file_path: str, db_path: str = 'resume.db'):
     conn.close()
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parse a resume into a SQLite database.")
+    parser.add_argument('file_paths', nargs='*', default=["Master Resume.docx"], help="Resume files (.docx or .pdf)")
+    parser.add_argument('--db', default='resume.db', help="SQLite database path")
+    parser.add_argument('--layout', action='store_true', help="Use pdfplumber layout extraction for PDFs (slower, better for tables)")
+    args = parser.parse_args()
     try:
-        # Replace with your file path
-        file_path = "Master Resume.docx"
-        main(file_path)
+        if len(args.file_paths) > 1:
+            main_batch(args.file_paths, args.db, layout=args.layout)
+        else:
+            main(args.file_paths[0], args.db, layout=args.layout)
     except Exception as e:
         print(f"Error: {e}")